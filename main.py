@@ -1,22 +1,49 @@
 # JeffaSEO — AI SEO toolkit (single-file). SERP-oriented keyword analysis, meta generation, sitemaps, scoring. Use for agents and on-chain claim payloads.
-# No dependencies beyond stdlib; optional: requests for fetch. Populated defaults; no placeholders.
+# No dependencies beyond stdlib; optional: requests for fetch, lxml for faster sitemap XML, numpy + numba for huge pages, mmh3 for fingerprints. Populated defaults; no placeholders.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import html
 import json
+import os
 import re
+import sys
+import tempfile
 import unicodedata
 import urllib.parse
 import urllib.request
+from array import array
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Iterator
-from xml.etree import ElementTree as ET
+from typing import IO, Any, Callable, Iterable, Iterator
+
+try:
+    from lxml import etree as ET
+    _JEFFA_ITERPARSE_KW: dict[str, Any] = {"resolve_entities": False}
+except ImportError:
+    from xml.etree import ElementTree as ET
+    _JEFFA_ITERPARSE_KW = {}
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import mmh3
+except ImportError:
+    mmh3 = None
 
 
 # ------------------------------------------------------------------------------
@@ -32,6 +59,7 @@ JEFFA_KEYWORD_DENSITY_FLOOR = 0.005
 JEFFA_KEYWORD_DENSITY_CEIL = 0.03
 JEFFA_SITEMAP_MAX_URLS = 50000
 JEFFA_SITEMAP_INDEX_MAX = 50000
+JEFFA_SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
 JEFFA_SCORE_BPS_CAP = 10000
 JEFFA_STOP_WORDS_EN = frozenset({
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "of",
@@ -49,7 +77,16 @@ JEFFA_READABILITY_MIN_WORDS = 300
 JEFFA_READABILITY_IDEAL_WORDS = 800
 JEFFA_H1_MAX_COUNT_RECOMMEND = 1
 JEFFA_HASH_ALGO = "sha256"
+# Keyword hashes and agent ids are BLAKE2b-256 (formerly SHA-256); stored ids must be re-derived once.
+# jeffa_claim_id stays on SHA-256, but claims built from jeffa_agent_id(...) get new on-chain ids too.
+JEFFA_ID_HASH = "blake2b"
+JEFFA_ID_DIGEST_SIZE = 32
 JEFFA_ANCHOR_SEED = "jeffa_anchor_seed_7f3b9e2a"
+JEFFA_HASH_PARALLEL_CHUNK = 128
+JEFFA_TOKENIZE_CACHE_MAX_LEN = 512
+JEFFA_NUMBA_MIN_TOKENS = 20000
+_DENSITY_FLOOR_BPS = round(JEFFA_KEYWORD_DENSITY_FLOOR * 10000)
+_DENSITY_CEIL_BPS = round(JEFFA_KEYWORD_DENSITY_CEIL * 10000)
 
 
 class SerpTier(Enum):
@@ -72,7 +109,7 @@ class ContentGrade(Enum):
 # Data structures
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class KeywordResult:
     keyword: str
     count: int
@@ -83,7 +120,50 @@ class KeywordResult:
     normalized: str
 
 
-@dataclass
+@dataclass(slots=True)
+class KeywordResultBatch:
+    # Column-per-field layout for many keywords; tier holds SerpTier values.
+    keywords: list[str]
+    normalized: list[str]
+    counts: array
+    density_bps: array
+    position_first: array
+    position_last: array
+    tier: array
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __getitem__(self, i: int | slice) -> KeywordResult | list[KeywordResult]:
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        return KeywordResult(
+            keyword=self.keywords[i],
+            count=self.counts[i],
+            density_bps=self.density_bps[i],
+            position_first=self.position_first[i],
+            position_last=self.position_last[i],
+            tier=SerpTier(self.tier[i]),
+            normalized=self.normalized[i],
+        )
+
+    def in_density_range(self) -> list[bool]:
+        lo = _DENSITY_FLOOR_BPS
+        hi = _DENSITY_CEIL_BPS
+        if np is not None:
+            d = np.frombuffer(self.density_bps, dtype=np.intc)
+            return ((d >= lo) & (d <= hi)).tolist()
+        return [lo <= d <= hi for d in self.density_bps]
+
+    def clamped_density_bps(self) -> list[int]:
+        lo = _DENSITY_FLOOR_BPS
+        hi = _DENSITY_CEIL_BPS
+        if np is not None:
+            return np.clip(np.frombuffer(self.density_bps, dtype=np.intc), lo, hi).tolist()
+        return [_clamp_bps(d, lo, hi) for d in self.density_bps]
+
+
+@dataclass(slots=True)
 class MetaTags:
     title: str
     description: str
@@ -101,7 +181,7 @@ class MetaTags:
     extra: list[tuple[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SerpSnippet:
     title: str
     url: str
@@ -111,7 +191,7 @@ class SerpSnippet:
     score_bps: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PageScore:
     total_bps: int
     title_score_bps: int
@@ -123,7 +203,7 @@ class PageScore:
     suggestions: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SitemapUrl:
     loc: str
     lastmod: str | None
@@ -135,73 +215,343 @@ class SitemapUrl:
 # Text normalization and hashing (for claim ids / keyword hashes)
 # ------------------------------------------------------------------------------
 
-def jeffa_normalize_keyword(raw: str) -> str:
+# Hash contexts that have already absorbed the constant prefixes; copied per call.
+# Claim ids stay on JEFFA_HASH_ALGO since they are anchored on-chain.
+_NS_PREFIX = (JEFFA_NAMESPACE + ":").encode("utf-8")
+_CLAIM_PREFIX = (JEFFA_ANCHOR_SEED + ":").encode("utf-8")
+_AGENT_PREFIX = (JEFFA_NAMESPACE + ":agent:").encode("utf-8")
+_KW_PREFIX_CTX = hashlib.new(JEFFA_ID_HASH, _NS_PREFIX, digest_size=JEFFA_ID_DIGEST_SIZE)
+_CLAIM_PREFIX_CTX = hashlib.new(JEFFA_HASH_ALGO, _CLAIM_PREFIX)
+_AGENT_PREFIX_CTX = hashlib.new(JEFFA_ID_HASH, _AGENT_PREFIX, digest_size=JEFFA_ID_DIGEST_SIZE)
+
+# CPython's HASHLIB_GIL_MINSIZE: smaller update() calls keep the GIL.
+_HASHLIB_GIL_MINSIZE = 2048
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_TOKEN_RE = re.compile(r"\w+")
+# ASCII punctuation -> space; mirrors _PUNCT_RE ("_" is a word character).
+_TOKEN_TRANS = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c == "_")
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def jeffa_normalize_keyword(raw: str, _nfkc=unicodedata.normalize, _ws_sub=_WS_RE.sub) -> str:
+    # Hot helpers bind their globals as defaults so lookups are locals, not module dict hits.
     s = raw.strip().lower()
-    s = unicodedata.normalize("NFKC", s)
-    s = re.sub(r"\s+", " ", s)
+    if s.isascii():
+        # NFKC is the identity on ASCII; split() collapses the same whitespace as \s+.
+        return " ".join(s.split())
+    s = _nfkc("NFKC", s)
+    s = _ws_sub(" ", s)
     return s.strip()
 
 
-def jeffa_keyword_hash(keyword: str) -> str:
+def jeffa_keyword_hash(keyword: str, _norm=jeffa_normalize_keyword, _copy=_KW_PREFIX_CTX.copy) -> str:
+    ctx = _copy()
+    ctx.update(_norm(keyword).encode("utf-8"))
+    return ctx.hexdigest()
+
+
+def jeffa_claim_id(
+    agent_id: str, keyword: str, nonce: str, _norm=jeffa_normalize_keyword, _copy=_CLAIM_PREFIX_CTX.copy
+) -> str:
+    ctx = _copy()
+    ctx.update(f"{agent_id}:{_norm(keyword)}:{nonce}".encode("utf-8"))
+    return ctx.hexdigest()
+
+
+def jeffa_agent_id(wallet_or_name: str, _copy=_AGENT_PREFIX_CTX.copy) -> str:
+    ctx = _copy()
+    ctx.update(wallet_or_name.encode("utf-8"))
+    return ctx.hexdigest()
+
+
+def jeffa_keyword_hash_many(keywords: list[str]) -> list[str]:
+    copy = _KW_PREFIX_CTX.copy
+    out: list[str] = []
+    for kw in keywords:
+        ctx = copy()
+        ctx.update(jeffa_normalize_keyword(kw).encode("utf-8"))
+        out.append(ctx.hexdigest())
+    return out
+
+
+def jeffa_hash_keywords_parallel(keywords: list[str], workers: int = 8) -> list[str]:
+    # hashlib only drops the GIL for updates of _HASHLIB_GIL_MINSIZE bytes or more, and
+    # normalization holds it throughout, so typical short keywords are hashed serially.
+    step = JEFFA_HASH_PARALLEL_CHUNK
+    if workers <= 1 or len(keywords) <= step:
+        return jeffa_keyword_hash_many(keywords)
+    if sum(map(len, keywords)) < _HASHLIB_GIL_MINSIZE * len(keywords):
+        return jeffa_keyword_hash_many(keywords)
+    chunks = [keywords[i:i + step] for i in range(0, len(keywords), step)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [h for part in pool.map(jeffa_keyword_hash_many, chunks) for h in part]
+
+
+def jeffa_file_digest(path: str | Path, algo: str = JEFFA_HASH_ALGO) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algo).hexdigest()
+        h = hashlib.new(algo)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def jeffa_keyword_fingerprint(keyword: str) -> int:
+    # In-memory dedup / index key only; use jeffa_keyword_hash for anything persisted or shared.
     norm = jeffa_normalize_keyword(keyword)
-    payload = f"{JEFFA_NAMESPACE}:{norm}"
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    if mmh3 is not None:
+        return mmh3.hash64(norm.encode("utf-8"))[0]
+    return hash(norm)
 
 
-def jeffa_claim_id(agent_id: str, keyword: str, nonce: str) -> str:
-    norm_kw = jeffa_normalize_keyword(keyword)
-    payload = f"{JEFFA_ANCHOR_SEED}:{agent_id}:{norm_kw}:{nonce}"
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+def jeffa_keyword_fingerprints(keywords: Iterable[str]) -> list[int]:
+    norms = [jeffa_normalize_keyword(kw) for kw in keywords]
+    if mmh3 is None:
+        return [hash(n) for n in norms]
+    h = mmh3.hash64
+    return [h(n.encode("utf-8"))[0] for n in norms]
 
 
-def jeffa_agent_id(wallet_or_name: str) -> str:
-    return hashlib.sha256(f"{JEFFA_NAMESPACE}:agent:{wallet_or_name}".encode("utf-8")).hexdigest()
+def jeffa_dedupe_keywords(keywords: Iterable[str]) -> list[str]:
+    seen: set[str] = set()
+    out: list[str] = []
+    for kw in keywords:
+        norm = jeffa_normalize_keyword(kw)
+        if norm not in seen:
+            seen.add(norm)
+            out.append(kw)
+    return out
+
+
+# ------------------------------------------------------------------------------
+# Sitemaps
+# ------------------------------------------------------------------------------
+
+def _jeffa_local_tag(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _jeffa_sitemap_url_from_elem(elem: ET.Element) -> SitemapUrl | None:
+    fields: dict[str, str] = {}
+    for child in elem:
+        # lxml yields comments / processing instructions as children with non-str tags.
+        if isinstance(child.tag, str) and child.text:
+            fields[_jeffa_local_tag(child.tag)] = child.text.strip()
+    loc = fields.get("loc")
+    if not loc:
+        return None
+    priority: float | None = None
+    if fields.get("priority"):
+        try:
+            priority = float(fields["priority"])
+        except ValueError:
+            priority = None
+    return SitemapUrl(
+        loc=loc,
+        lastmod=fields.get("lastmod") or None,
+        changefreq=fields.get("changefreq") or None,
+        priority=priority,
+    )
+
+
+def jeffa_iter_sitemap(source: str | Path | IO[bytes]) -> Iterator[SitemapUrl]:
+    # Stream <url> entries and drop each one once read so memory stays flat on 50k-URL files.
+    root: ET.Element | None = None
+    for event, elem in ET.iterparse(source, events=("start", "end"), **_JEFFA_ITERPARSE_KW):
+        if root is None:
+            root = elem
+            continue
+        if event != "end" or _jeffa_local_tag(elem.tag) != "url":
+            continue
+        url = _jeffa_sitemap_url_from_elem(elem)
+        if url is not None:
+            yield url
+        root.clear()
+
+
+def jeffa_write_sitemap(path: str | Path, urls: Iterable[SitemapUrl]) -> int:
+    # One small element serialized per URL; the full tree is never built. Output goes to a
+    # temp file beside `path` and replaces it only once complete, so a failure leaves it intact.
+    count = 0
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(f'<urlset xmlns="{JEFFA_SITEMAP_XMLNS}">\n')
+            for url in urls:
+                count += 1
+                if count > JEFFA_SITEMAP_MAX_URLS:
+                    raise ValueError(f"sitemap exceeds {JEFFA_SITEMAP_MAX_URLS} urls")
+                el = ET.Element("url")
+                ET.SubElement(el, "loc").text = url.loc
+                if url.lastmod:
+                    ET.SubElement(el, "lastmod").text = url.lastmod
+                if url.changefreq:
+                    ET.SubElement(el, "changefreq").text = url.changefreq
+                if url.priority is not None:
+                    ET.SubElement(el, "priority").text = format(url.priority, "g")
+                f.write(ET.tostring(el, encoding="unicode"))
+                f.write("\n")
+            f.write("</urlset>\n")
+        # mkstemp creates the file 0600; keep the old file's mode or use the usual 0644.
+        os.chmod(tmp, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return count
 
 
 # ------------------------------------------------------------------------------
 # Keyword extraction and density
 # ------------------------------------------------------------------------------
 
+def _jeffa_tokenize_uncached(text: str) -> list[str]:
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+        if not text.isascii():
+            text = _PUNCT_RE.sub(" ", text)
+            return [sys.intern(t.lower()) for t in text.split() if t]
+    # Interned tokens share one object per word, so set/dict lookups reuse the cached hash.
+    return [sys.intern(t) for t in text.translate(_TOKEN_TRANS).lower().split()]
+
+
+@functools.lru_cache(maxsize=2048)
+def _jeffa_tokenize_cached(text: str) -> tuple[str, ...]:
+    return tuple(_jeffa_tokenize_uncached(text))
+
+
 def jeffa_tokenize(text: str) -> list[str]:
-    text = unicodedata.normalize("NFKC", text)
-    text = re.sub(r"[^\w\s]", " ", text)
-    return [t.lower() for t in text.split() if t]
+    # Short titles/descriptions repeat across pages; full bodies are not worth caching.
+    if len(text) <= JEFFA_TOKENIZE_CACHE_MAX_LEN:
+        return list(_jeffa_tokenize_cached(text))
+    return _jeffa_tokenize_uncached(text)
+
+
+def jeffa_itokenize(text: str) -> Iterator[str]:
+    # Same tokens as jeffa_tokenize (maximal \w runs), yielded lazily for Counter / single-pass consumers.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    for m in _TOKEN_RE.finditer(text):
+        yield sys.intern(m.group().lower())
 
 
-def jeffa_extract_keywords(text: str, min_len: int = 2, stop_words: frozenset[str] | None = None) -> list[str]:
+def jeffa_extract_keywords(text: str | list[str], min_len: int = 2, stop_words: frozenset[str] | None = None) -> list[str]:
     stop = stop_words or JEFFA_STOP_WORDS_EN
-    tokens = jeffa_tokenize(text)
+    tokens = jeffa_tokenize(text) if isinstance(text, str) else text
     return [t for t in tokens if len(t) >= min_len and t not in stop]
 
 
-def jeffa_keyword_density_bps(text: str, keyword: str) -> int:
-    tokens = jeffa_tokenize(text)
+def jeffa_keyword_density_bps(text: str | list[str], keyword: str) -> int:
+    tokens = jeffa_tokenize(text) if isinstance(text, str) else text
     if not tokens:
         return 0
     kw_norm = jeffa_normalize_keyword(keyword)
     kw_tokens = jeffa_tokenize(kw_norm)
     if not kw_tokens:
         return 0
+    count = _jeffa_count_phrase(tokens, kw_tokens)
+    return (count * 10000) // len(tokens)
+
+
+def _clamp_bps(x: int, lo: int, hi: int) -> int:
+    return (x if x > lo else lo) if x < hi else hi
+
+
+def _jeffa_count_phrase(tokens: list[str], kw_tokens: list[str]) -> int:
+    if len(kw_tokens) == 1:
+        return tokens.count(kw_tokens[0])
+    # Tokens never contain spaces, so space-padded substrings match whole tokens only.
+    # Overlapping matches count, as with the token-window scan.
+    hay = " " + " ".join(tokens) + " "
+    needle = " " + " ".join(kw_tokens) + " "
     count = 0
-    for i in range(len(tokens) - len(kw_tokens) + 1):
-        if tokens[i:i + len(kw_tokens)] == kw_tokens:
-            count += 1
-    return (count * 10000) // len(tokens) if tokens else 0
+    i = hay.find(needle)
+    while i >= 0:
+        count += 1
+        i = hay.find(needle, i + 1)
+    return count
+
 
+def _build_ngram_counters(tokens: list[str], max_n: int = 3) -> dict[int, Counter[tuple[str, ...]]]:
+    return {n: Counter(zip(*(tokens[i:] for i in range(n)))) for n in range(1, max_n + 1)}
 
-def jeffa_analyze_keyword_in_text(text: str, keyword: str) -> KeywordResult:
+
+def jeffa_keyword_densities_bps(text: str | list[str], keywords: list[str], max_n: int = 3) -> list[int]:
+    tokens = jeffa_tokenize(text) if isinstance(text, str) else text
+    if not tokens:
+        return [0] * len(keywords)
+    counters = _build_ngram_counters(tokens, max_n)
+    total = len(tokens)
+    out: list[int] = []
+    for keyword in keywords:
+        kw_tokens = jeffa_tokenize(jeffa_normalize_keyword(keyword))
+        n = len(kw_tokens)
+        if not n:
+            out.append(0)
+            continue
+        count = counters[n][tuple(kw_tokens)] if n <= max_n else _jeffa_count_phrase(tokens, kw_tokens)
+        out.append((count * 10000) // total)
+    return out
+
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _jeffa_match_positions_nb(ids, kw_ids):
+        n = ids.shape[0]
+        m = kw_ids.shape[0]
+        count = 0
+        first = -1
+        last = -1
+        for i in range(n - m + 1):
+            j = 0
+            while j < m and ids[i + j] == kw_ids[j]:
+                j += 1
+            if j == m:
+                count += 1
+                if first < 0:
+                    first = i
+                last = i
+        return count, first, last
+else:
+    _jeffa_match_positions_nb = None
+
+
+def _jeffa_intern_tokens(tokens: list[str]) -> tuple[Any, dict[str, int]]:
+    vocab: dict[str, int] = {}
+    ids = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens), dtype=np.int32, count=len(tokens))
+    return ids, vocab
+
+
+def _jeffa_phrase_positions_ids(token_ids: tuple[Any, dict[str, int]], kw_tokens: list[str]) -> tuple[int, int, int]:
+    ids, vocab = token_ids
+    kw_ids = [vocab.get(t, -1) for t in kw_tokens]
+    if -1 in kw_ids:
+        return 0, -1, -1
+    count, first, last = _jeffa_match_positions_nb(ids, np.asarray(kw_ids, dtype=np.int32))
+    return int(count), int(first), int(last)
+
+
+def jeffa_analyze_keyword_in_text(
+    text: str | list[str], keyword: str, counts: Counter[str] | None = None
+) -> KeywordResult:
+    tokens = jeffa_tokenize(text) if isinstance(text, str) else text
+    return _jeffa_analyze_tokens(tokens, keyword, counts, None)
+
+
+def _jeffa_analyze_tokens(
+    tokens: list[str],
+    keyword: str,
+    counts: Counter[str] | None,
+    token_ids: tuple[Any, dict[str, int]] | None,
+) -> KeywordResult:
     norm_kw = jeffa_normalize_keyword(keyword)
-    tokens = jeffa_tokenize(text)
-    kw_tokens = jeffa_tokenize(norm_kw)
-    count = 0
-    first = -1
-    last = -1
-    for i in range(len(tokens) - len(kw_tokens) + 1):
-        if tokens[i:i + len(kw_tokens)] == kw_tokens:
-            count += 1
-            if first < 0:
-                first = i
-            last = i
+    count, first, last = _jeffa_match_keyword(tokens, jeffa_tokenize(norm_kw), counts, token_ids)
     density_bps = (count * 10000) // len(tokens) if tokens else 0
     tier = _jeffa_infer_tier(keyword, count)
     return KeywordResult(
@@ -215,6 +565,72 @@ def jeffa_analyze_keyword_in_text(text: str, keyword: str) -> KeywordResult:
     )
 
 
+def _jeffa_match_keyword(
+    tokens: list[str],
+    kw_tokens: list[str],
+    counts: Counter[str] | None,
+    token_ids: tuple[Any, dict[str, int]] | None,
+) -> tuple[int, int, int]:
+    count = 0
+    first = -1
+    last = -1
+    if len(kw_tokens) == 1:
+        kw = kw_tokens[0]
+        count = counts[kw] if counts is not None else tokens.count(kw)
+        if count:
+            first = tokens.index(kw)
+            last = first if count == 1 else len(tokens) - 1 - tokens[::-1].index(kw)
+    elif token_ids is not None:
+        count, first, last = _jeffa_phrase_positions_ids(token_ids, kw_tokens)
+    else:
+        for i in range(len(tokens) - len(kw_tokens) + 1):
+            if tokens[i:i + len(kw_tokens)] == kw_tokens:
+                count += 1
+                if first < 0:
+                    first = i
+                last = i
+    return count, first, last
+
+
+def _jeffa_index_page(text: str) -> tuple[list[str], Counter[str], tuple[Any, dict[str, int]] | None]:
+    tokens = jeffa_tokenize(text)
+    counts = Counter(tokens)
+    # Long pages: intern tokens once so multi-word keywords are matched in compiled code.
+    token_ids = None
+    if _jeffa_match_positions_nb is not None and len(tokens) >= JEFFA_NUMBA_MIN_TOKENS:
+        token_ids = _jeffa_intern_tokens(tokens)
+    return tokens, counts, token_ids
+
+
+def jeffa_analyze_page(text: str, keywords: list[str]) -> list[KeywordResult]:
+    tokens, counts, token_ids = _jeffa_index_page(text)
+    return [_jeffa_analyze_tokens(tokens, kw, counts, token_ids) for kw in keywords]
+
+
+def jeffa_analyze_page_batch(text: str, keywords: list[str]) -> KeywordResultBatch:
+    tokens, counts, token_ids = _jeffa_index_page(text)
+    total = len(tokens)
+    batch = KeywordResultBatch(
+        keywords=list(keywords),
+        normalized=[],
+        counts=array("i"),
+        density_bps=array("i"),
+        position_first=array("i"),
+        position_last=array("i"),
+        tier=array("B"),
+    )
+    for keyword in keywords:
+        norm_kw = jeffa_normalize_keyword(keyword)
+        count, first, last = _jeffa_match_keyword(tokens, jeffa_tokenize(norm_kw), counts, token_ids)
+        batch.normalized.append(norm_kw)
+        batch.counts.append(count)
+        batch.density_bps.append((count * 10000) // total if total else 0)
+        batch.position_first.append(first)
+        batch.position_last.append(last)
+        batch.tier.append(_jeffa_infer_tier(keyword, count).value)
+    return batch
+
+
 def _jeffa_infer_tier(keyword: str, count: int) -> SerpTier:
     word_count = len(keyword.split())
     if word_count >= 4: